@@ -1,4 +1,6 @@
 import os
+import multiprocessing
+from backend import runtime
 from flask import Flask, render_template, request, jsonify, send_from_directory
 from werkzeug.utils import secure_filename
 from backend.script_analysis import parse_script
@@ -15,6 +17,23 @@ if not os.path.exists(app.config["UPLOAD_FOLDER"]):
 if not os.path.exists(app.config["OUTPUT_FOLDER"]):
     os.makedirs(app.config["OUTPUT_FOLDER"])
 
+# Startup tuning (heavy ML libraries are otherwise loaded on first use)
+# AI_EDITOR_PRELOAD: comma-separated capabilities to load at startup, e.g. "vision,nlp" or "all"
+# AI_EDITOR_ANALYSIS_WORKERS: number of pre-warmed video analysis worker processes (0 = analyze in-process)
+# Both are applied when the serving process imports this module (python app.py, flask run,
+# gunicorn, ...). With gunicorn, don't combine analysis workers with --preload: the pool
+# would be created in the master and does not survive the fork into the workers.
+def _read_worker_count():
+    value = os.environ.get("AI_EDITOR_ANALYSIS_WORKERS", "0")
+    try:
+        return max(int(value), 0)
+    except ValueError:
+        print(f"[Startup] Ignoring AI_EDITOR_ANALYSIS_WORKERS={value!r}, expected an integer")
+        return 0
+
+app.config["PRELOAD"] = os.environ.get("AI_EDITOR_PRELOAD", "")
+app.config["ANALYSIS_WORKERS"] = _read_worker_count()
+
 @app.route("/")
 def index():
     return render_template("index.html")
@@ -136,5 +155,55 @@ def detect_emotion():
         print(f"Emotion detect error: {e}")
         return jsonify({"error": str(e)}), 500
 
+
+@app.route("/startup_report")
+def startup_report():
+    return jsonify(runtime.startup_report())
+
+
+_warmed_up = False
+
+def warm_up():
+    """
+    Applies the startup tuning options and prints the startup report.
+    Runs automatically on import in the serving process; later calls do nothing.
+    """
+    global _warmed_up
+    if _warmed_up:
+        return
+    _warmed_up = True
+
+    preload = app.config["PRELOAD"].strip().lower()
+    if preload == "all":
+        runtime.preload()
+    elif preload:
+        runtime.preload(*[c.strip() for c in preload.split(",") if c.strip()])
+    if runtime.start_analysis_pool(app.config["ANALYSIS_WORKERS"]) is not None:
+        # The pool only runs per-video analysis. Text matching, rendering and
+        # /detect_emotion still run here, so load them now rather than on the first request.
+        runtime.preload("nlp", "render", "vision")
+    runtime.mark("app_ready")
+    runtime.print_startup_report()
+
+
+def _warm_up_skip_reason():
+    # Analysis pool workers may re-import this module (spawn/forkserver)
+    if multiprocessing.parent_process() is not None:
+        return "running in an analysis worker"
+    # app.run(debug=True) below starts the reloader; only its child process
+    # (WERKZEUG_RUN_MAIN) serves requests
+    if __name__ == "__main__" and os.environ.get("WERKZEUG_RUN_MAIN") != "true":
+        return "debug reloader watcher process, the serving child warms up instead"
+    return None
+
+
+runtime.mark("app_imported")
+
+_skip_reason = _warm_up_skip_reason()
+if _skip_reason is None:
+    warm_up()
+elif multiprocessing.parent_process() is None:
+    print(f"[Startup] Skipping warm-up: {_skip_reason}")
+
 if __name__ == "__main__":
     app.run(debug=True)
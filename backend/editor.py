@@ -1,9 +1,5 @@
-from moviepy import VideoFileClip, concatenate_videoclips
 import os
-import imageio_ffmpeg
-
-# Explicitly set ffmpeg path for moviepy to avoid detection issues
-os.environ["IMAGEIO_FFMPEG_EXE"] = imageio_ffmpeg.get_ffmpeg_exe()
+from backend.runtime import load
 
 def create_rough_cut(matches, output_path):
     """
@@ -11,6 +7,9 @@ def create_rough_cut(matches, output_path):
     matches: List of dictionaries containing 'video_path'
     output_path: Path to save the output video
     """
+    load("render")
+    from moviepy import VideoFileClip, concatenate_videoclips
+
     clips = []
     final_clip = None
     
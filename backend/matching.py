@@ -1,7 +1,7 @@
 import os
 import random
 from backend.script_analysis import calculate_text_similarity
-from backend.video_processing import extract_audio_text, analyze_emotion_frames, extract_features
+from backend.runtime import analyze_videos
 
 def match_scenes_to_videos(scenes, video_files, preferences={}):
     """
@@ -27,18 +27,9 @@ def match_scenes_to_videos(scenes, video_files, preferences={}):
 
     # 1. Pre-process videos (Extract ML Features)
     # Cache features to avoid re-processing in loops
-    video_features = {}
+    # Runs on the pre-warmed analysis pool when one is started
     print("Extracting ML features from videos...")
-    for v in video_files:
-        print(f"Processing {v}...")
-        text = extract_audio_text(v)
-        emotion = analyze_emotion_frames(v)
-        visuals = extract_features(v)
-        video_features[v] = {
-            "text": text,
-            "emotion": emotion,
-            "visuals": visuals
-        }
+    video_features = analyze_videos(video_files)
 
     used_videos = set()
     total_confidence = 0
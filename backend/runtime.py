@@ -0,0 +1,230 @@
+import os
+import time
+import importlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Reference point for the startup report (this module is imported first by app.py)
+_BOOT_TIME = time.perf_counter()
+
+# Heavy dependencies grouped by the capability that needs them.
+# Nothing here is imported until a capability is first used.
+CAPABILITIES = {
+    "vision": ["numpy", "cv2"],
+    "speech": ["imageio_ffmpeg", "moviepy", "speech_recognition"],
+    "render": ["imageio_ffmpeg", "moviepy"],
+    "nlp": ["sklearn.feature_extraction.text", "sklearn.metrics.pairwise"],
+}
+
+# How long a pool worker waits for its siblings to finish warming up
+_WARMUP_TIMEOUT = 600
+
+_load_lock = threading.Lock()
+_pool_lock = threading.Lock()
+_module_times = {}
+_capability_times = {}
+_milestones = {}
+_analysis_pool = None
+_analysis_workers = 0
+_analysis_pool_seconds = None
+_pool_capabilities = {}
+
+# Capabilities each pool worker loads in _warm_worker. NLP and rendering run
+# in the serving process, so the workers don't need them.
+POOL_CAPABILITIES = ("vision", "speech")
+
+# Set in each pool worker by _warm_worker
+_worker_barrier = None
+
+
+def _configure_ffmpeg():
+    # Explicitly set ffmpeg path for moviepy to avoid detection issues.
+    # Must happen before moviepy is imported for the first time.
+    import imageio_ffmpeg
+    os.environ["IMAGEIO_FFMPEG_EXE"] = imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def load(capability):
+    """
+    Imports the heavy dependencies behind a capability on first use.
+    Later calls are a dictionary lookup, so call this at the top of any function
+    that needs the modules and then import them locally.
+    """
+    if capability in _capability_times:
+        return
+    if capability not in CAPABILITIES:
+        raise ValueError(f"Unknown capability '{capability}', expected one of {sorted(CAPABILITIES)}")
+
+    with _load_lock:
+        if capability in _capability_times:
+            return
+        # Modules shared between capabilities are timed once and counted
+        # under the capability that loaded them first.
+        total = 0.0
+        for module_name in CAPABILITIES[capability]:
+            if module_name in _module_times:
+                continue
+            start = time.perf_counter()
+            if module_name == "moviepy" and "IMAGEIO_FFMPEG_EXE" not in os.environ:
+                _configure_ffmpeg()
+            importlib.import_module(module_name)
+            _module_times[module_name] = time.perf_counter() - start
+            total += _module_times[module_name]
+        _capability_times[capability] = total
+
+
+def preload(*capabilities):
+    """
+    Loads the given capabilities (all of them by default) up front.
+    Names are case-insensitive; unknown names are reported and skipped.
+    """
+    for capability in capabilities or CAPABILITIES:
+        name = capability.strip().lower()
+        if name not in CAPABILITIES:
+            print(f"[Startup] Ignoring unknown capability '{capability}' (expected one of {', '.join(CAPABILITIES)})")
+            continue
+        load(name)
+
+
+def mark(name):
+    """
+    Records a startup milestone as seconds since the backend was first imported.
+    """
+    _milestones[name] = time.perf_counter() - _BOOT_TIME
+
+
+def startup_report():
+    """
+    Returns startup timings: milestones, per-capability and per-module import cost,
+    and the analysis pool size and warm-up time. pool_capabilities holds the
+    slowest worker's import time for each capability loaded in the pool.
+    Capabilities that have not been loaded yet are reported as None.
+    """
+    return {
+        "milestones": {k: round(v, 3) for k, v in _milestones.items()},
+        "capabilities": {
+            name: round(_capability_times[name], 3) if name in _capability_times else None
+            for name in CAPABILITIES
+        },
+        "modules": {k: round(v, 3) for k, v in _module_times.items()},
+        "analysis_workers": _analysis_workers,
+        "analysis_pool_seconds": None if _analysis_pool_seconds is None else round(_analysis_pool_seconds, 3),
+        "pool_capabilities": {k: round(v, 3) for k, v in _pool_capabilities.items()},
+    }
+
+
+def print_startup_report():
+    report = startup_report()
+    print("[Startup] Milestones (seconds since boot):")
+    for name, seconds in report["milestones"].items():
+        print(f"  {name}: {seconds:.3f}s")
+    print("[Startup] Capability load times:")
+    for name, seconds in report["capabilities"].items():
+        print(f"  {name}: {'not loaded' if seconds is None else f'{seconds:.3f}s'}")
+    print(f"[Startup] Analysis workers: {report['analysis_workers']}")
+    if report["analysis_pool_seconds"] is not None:
+        print(f"[Startup] Analysis pool warm-up: {report['analysis_pool_seconds']:.3f}s")
+    if report["pool_capabilities"]:
+        print("[Startup] Pool worker load times (slowest worker):")
+        for name, seconds in report["pool_capabilities"].items():
+            print(f"  {name}: {seconds:.3f}s")
+
+
+def _warm_worker(barrier):
+    # Runs once in each pool process so requests never pay the import cost
+    global _worker_barrier
+    _worker_barrier = barrier
+    preload(*POOL_CAPABILITIES)
+
+
+def _worker_ready(_):
+    # Blocks until every worker has finished _warm_worker, so each of the
+    # startup tasks is answered by a different process.
+    _worker_barrier.wait(_WARMUP_TIMEOUT)
+    return os.getpid(), dict(_capability_times)
+
+
+def start_analysis_pool(workers):
+    """
+    Starts a pool of pre-warmed worker processes for video analysis.
+    Each worker loads the analysis models once and then serves requests.
+    Returns None and keeps analysis in-process if the workers fail to start.
+    """
+    global _analysis_pool, _analysis_workers, _analysis_pool_seconds, _pool_capabilities
+    with _pool_lock:
+        if _analysis_pool is not None or workers <= 0:
+            return _analysis_pool
+
+        start = time.perf_counter()
+        pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_warm_worker,
+            initargs=(multiprocessing.Barrier(workers),)
+        )
+        try:
+            # One task per worker; the barrier keeps any worker from taking a
+            # second one, so this returns only once all of them are warm.
+            answers = list(pool.map(_worker_ready, range(workers)))
+            pids = {pid for pid, _ in answers}
+            if len(pids) != workers:
+                raise RuntimeError(f"only {len(pids)} of {workers} workers answered")
+        except Exception as e:
+            print(f"[Startup] Analysis pool failed to start ({e}), analyzing in-process instead")
+            pool.shutdown(wait=True, cancel_futures=True)
+            return None
+
+        _analysis_pool = pool
+        _analysis_workers = workers
+        _analysis_pool_seconds = time.perf_counter() - start
+        _pool_capabilities = {}
+        for _, times in answers:
+            for name, seconds in times.items():
+                _pool_capabilities[name] = max(seconds, _pool_capabilities.get(name, 0.0))
+    mark("analysis_pool_ready")
+    print(f"[Startup] Analysis pool ready with {workers} workers")
+    return pool
+
+
+def _discard_pool(pool):
+    # Detach the pool first so no new request picks it up, then shut it down
+    # outside the lock. Requests already using it keep their own reference.
+    global _analysis_pool, _analysis_workers, _analysis_pool_seconds, _pool_capabilities
+    with _pool_lock:
+        if _analysis_pool is not pool:
+            return
+        _analysis_pool = None
+        _analysis_workers = 0
+        _analysis_pool_seconds = None
+        _pool_capabilities = {}
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+def shutdown_analysis_pool():
+    pool = _analysis_pool
+    if pool is not None:
+        _discard_pool(pool)
+
+
+def analyze_videos(video_paths):
+    """
+    Runs analyze_video on each path, using the warm pool when one is running.
+    Returns a dict mapping path -> features.
+    Falls back to in-process analysis if the pool is unavailable.
+    """
+    from backend.video_processing import analyze_video
+
+    # Each path is analyzed once; parallel runs on the same file would also
+    # clash on the temporary audio file extract_audio_text writes next to it.
+    unique_paths = list(dict.fromkeys(video_paths))
+
+    pool = _analysis_pool
+    if pool is not None:
+        try:
+            return dict(zip(unique_paths, pool.map(analyze_video, unique_paths)))
+        except BrokenProcessPool as e:
+            print(f"Analysis pool failed ({e}), falling back to in-process analysis")
+            _discard_pool(pool)
+
+    return {v: analyze_video(v) for v in unique_paths}
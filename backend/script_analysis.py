@@ -1,6 +1,5 @@
 import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from backend.runtime import load
 
 
 def parse_script(text):
@@ -74,7 +73,11 @@ def calculate_text_similarity(text1, text2):
     """
     if not text1 or not text2:
         return 0.0
-        
+
+    load("nlp")
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
     try:
         # Create a tiny corpus of just these two texts
         corpus = [text1, text2]
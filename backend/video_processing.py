@@ -1,14 +1,15 @@
-import cv2
-import numpy as np
-import speech_recognition as sr
-from moviepy import VideoFileClip
 import os
+from backend.runtime import load
 
 
 def extract_features(video_path):
     """
     Extracts basic features from a video file: duration, fps, and average color of middle frame.
     """
+    load("vision")
+    import cv2
+    import numpy as np
+
     cap = cv2.VideoCapture(video_path)
     if not cap.isOpened():
         return None
@@ -43,6 +44,10 @@ def extract_audio_text(video_path):
     Extracts audio from video and converts it to text using SpeechRecognition.
     Returns the transcribed text.
     """
+    load("speech")
+    import speech_recognition as sr
+    from moviepy import VideoFileClip
+
     try:
         # Extract audio to a temporary file
         clip = VideoFileClip(video_path)
@@ -120,3 +125,15 @@ def analyze_emotion_frames(video_path):
     except:
         return "neutral"
 
+
+def analyze_video(video_path):
+    """
+    Runs the full per-video analysis used by the matching engine.
+    Kept as a top-level function so it can be sent to the analysis worker pool.
+    """
+    print(f"Processing {video_path}...")
+    return {
+        "text": extract_audio_text(video_path),
+        "emotion": analyze_emotion_frames(video_path),
+        "visuals": extract_features(video_path)
+    }
@@ -0,0 +1,151 @@
+import os
+import sys
+import subprocess
+import tempfile
+import multiprocessing
+
+import pytest
+
+# Add current directory to path so imports work
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(REPO_DIR)
+
+from backend import runtime
+import backend.video_processing
+
+HEAVY_MODULES = ["cv2", "numpy", "moviepy", "sklearn", "speech_recognition", "imageio_ffmpeg"]
+
+# Cheap stdlib stand-ins for the heavy dependencies
+CHEAP_CAPABILITIES = {
+    "vision": ["json"],
+    "speech": ["csv", "wave"],
+    "render": ["wave"],
+    "nlp": ["difflib"],
+}
+
+# Pool workers only see a patched CAPABILITIES when they are forked
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork",
+    reason="pool tests patch CAPABILITIES, which only forked workers inherit"
+)
+
+
+@pytest.fixture
+def cheap_runtime(monkeypatch):
+    monkeypatch.setattr(runtime, "CAPABILITIES", dict(CHEAP_CAPABILITIES))
+    monkeypatch.setattr(runtime, "_capability_times", {})
+    monkeypatch.setattr(runtime, "_module_times", {})
+    yield runtime
+    runtime.shutdown_analysis_pool()
+
+
+def _loaded_heavy_modules(import_line):
+    # Import in a fresh interpreter so modules loaded by this process don't leak in
+    code = (
+        "import sys\n"
+        f"{import_line}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    env = {k: v for k, v in os.environ.items() if not k.startswith("AI_EDITOR_")}
+    env["PYTHONPATH"] = REPO_DIR
+    with tempfile.TemporaryDirectory() as workdir:
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=workdir, env=env, capture_output=True, text=True, check=True
+        )
+    return result.stdout.strip().splitlines()[-1] if result.stdout.strip() else ""
+
+
+def test_backend_import_is_lazy():
+    loaded = _loaded_heavy_modules(
+        "import backend.matching, backend.editor, backend.video_processing, backend.script_analysis"
+    )
+    assert loaded == "", f"backend import loaded: {loaded}"
+
+
+def test_app_import_is_lazy():
+    pytest.importorskip("flask")
+    loaded = _loaded_heavy_modules("import app")
+    assert loaded == "", f"app import loaded: {loaded}"
+
+
+def test_startup_report_route(monkeypatch, tmp_path):
+    pytest.importorskip("flask")
+    monkeypatch.chdir(tmp_path)
+    for name in ("AI_EDITOR_PRELOAD", "AI_EDITOR_ANALYSIS_WORKERS"):
+        monkeypatch.delenv(name, raising=False)
+    import app
+
+    response = app.app.test_client().get("/startup_report")
+    assert response.status_code == 200
+    report = response.get_json()
+    assert "app_ready" in report["milestones"]
+    assert set(report["capabilities"]) == set(runtime.CAPABILITIES)
+    assert report["analysis_workers"] == 0
+
+
+def test_preload_skips_unknown_names(cheap_runtime, capsys):
+    cheap_runtime.preload(" Vision ", "video")
+
+    assert "Ignoring unknown capability 'video'" in capsys.readouterr().out
+    report = cheap_runtime.startup_report()
+    assert report["capabilities"]["vision"] is not None
+    assert report["capabilities"]["nlp"] is None
+    assert set(report["modules"]) == {"json"}
+
+
+def test_shared_modules_are_timed_once(cheap_runtime):
+    cheap_runtime.load("speech")
+    cheap_runtime.load("render")
+
+    report = cheap_runtime.startup_report()
+    assert set(report["modules"]) == {"csv", "wave"}
+    assert report["capabilities"]["render"] == 0.0
+
+
+@requires_fork
+def test_start_analysis_pool_waits_for_every_worker(cheap_runtime):
+    assert cheap_runtime.start_analysis_pool(3) is not None
+
+    report = cheap_runtime.startup_report()
+    assert report["analysis_workers"] == 3
+    assert report["analysis_pool_seconds"] is not None
+    assert "analysis_pool_ready" in report["milestones"]
+    assert set(report["pool_capabilities"]) == set(runtime.POOL_CAPABILITIES)
+    # Workers load their capabilities; the serving process does not
+    assert report["capabilities"]["vision"] is None
+
+
+@requires_fork
+def test_start_analysis_pool_falls_back_when_a_worker_fails(cheap_runtime, monkeypatch):
+    monkeypatch.setitem(cheap_runtime.CAPABILITIES, "speech", ["no_such_module_for_tests"])
+
+    assert cheap_runtime.start_analysis_pool(2) is None
+
+    report = cheap_runtime.startup_report()
+    assert report["analysis_workers"] == 0
+    assert report["analysis_pool_seconds"] is None
+    assert report["pool_capabilities"] == {}
+
+
+@requires_fork
+def test_analyze_videos_falls_back_when_pool_breaks(cheap_runtime, monkeypatch):
+    analyzed = []
+
+    def fake_analyze_video(video_path):
+        analyzed.append(video_path)
+        return {"text": "", "emotion": "neutral", "visuals": None}
+
+    monkeypatch.setattr(backend.video_processing, "analyze_video", fake_analyze_video)
+
+    pool = cheap_runtime.start_analysis_pool(1)
+    assert pool is not None
+    # Kill the only worker so the pool is broken by the time analysis runs
+    with pytest.raises(Exception):
+        pool.submit(os._exit, 1).result()
+
+    features = cheap_runtime.analyze_videos(["a.mp4", "b.mp4", "a.mp4"])
+
+    assert set(features) == {"a.mp4", "b.mp4"}
+    assert analyzed == ["a.mp4", "b.mp4"]
+    assert cheap_runtime.startup_report()["analysis_workers"] == 0